@@ -1,10 +1,19 @@
-import os, collections
+import os
+from operator import itemgetter, methodcaller
+from concurrent.futures import ThreadPoolExecutor
 root = r"D:\music-production\samples\trainingset"
-counts = collections.Counter()
-for name in os.listdir(root):
-  p = os.path.join(root, name)
-  if os.path.isdir(p):
-      cnt = sum(1 for _ in os.scandir(p) if _.is_file())
-      counts[name] = cnt
-for k,v in counts.most_common():
+is_file = methodcaller("is_file", follow_symlinks=False)
+
+def count_files(path):
+  with os.scandir(path) as sub:
+    return sum(map(is_file, sub))
+
+with os.scandir(root) as it:
+  subdirs = [d for d in it if d.is_dir(follow_symlinks=False)]
+items = []
+if subdirs:
+  with ThreadPoolExecutor(max_workers=min(32, len(subdirs))) as ex:
+    items = list(zip((d.name for d in subdirs), ex.map(count_files, (d.path for d in subdirs))))
+items.sort(key=itemgetter(1), reverse=True)
+for k,v in items:
   print(f"{k}: {v}")